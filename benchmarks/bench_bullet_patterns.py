@@ -0,0 +1,58 @@
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from config import *
+from game.entities.bullets import EnemyBullet
+from game.entities.patterns import BulletPattern, PatternEmitter, PatternType
+
+DENSITIES = (250, 500, 1000, 2000, 4000)
+ORIGIN = (WIDTH // 2, HEIGHT // 2)
+TARGET = (WIDTH // 2, HEIGHT - 50)
+TICKS = 60
+SPAWN_REPEAT = 10
+
+def spawn_naive(count, all_sprites, enemy_bullets):
+    for i in range(count):
+        bullet = EnemyBullet(ORIGIN[0], ORIGIN[1], i * 360 / count)
+        all_sprites.add(bullet)
+        enemy_bullets.add(bullet)
+
+def spawn_batched(count, all_sprites, enemy_bullets):
+    emitter = PatternEmitter()
+    emitter.fire(BulletPattern(PatternType.RADIAL, count=count, interval=0), ORIGIN, TARGET, all_sprites, enemy_bullets)
+
+def measure(spawn, count):
+    # Melhor de SPAWN_REPEAT execuções: uma medição isolada é dominada por ruído e GC
+    spawn_time = float('inf')
+    for _ in range(SPAWN_REPEAT):
+        all_sprites = pygame.sprite.Group()
+        enemy_bullets = pygame.sprite.Group()
+        start = time.perf_counter()
+        spawn(count, all_sprites, enemy_bullets)
+        spawn_time = min(spawn_time, time.perf_counter() - start)
+
+    # Mantém a densidade constante durante as medições de update
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        all_sprites.update()
+    update_time = (time.perf_counter() - start) / TICKS
+    return spawn_time, update_time
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    print(f"{'balas':>6} | {'spawn ingênuo':>14} | {'spawn em lote':>14} | {'balas/s (lote)':>15} | {'update/tick':>12}")
+    for count in DENSITIES:
+        naive_spawn, _ = measure(spawn_naive, count)
+        batch_spawn, update_time = measure(spawn_batched, count)
+        print(f"{count:>6} | {naive_spawn * 1000:>11.3f} ms | {batch_spawn * 1000:>11.3f} ms | "
+              f"{count / batch_spawn:>15,.0f} | {update_time * 1000:>9.3f} ms")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
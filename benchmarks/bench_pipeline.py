@@ -0,0 +1,79 @@
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from config import *
+from main import AstroSmash
+from game.entities.enemies import Enemy, EnemyType
+from game.entities.patterns import BulletPattern, PatternEmitter, PatternType
+from game.managers.render import RenderTarget
+
+FRAMES = 300
+# Intervalo zero: uma rajada por tick, independente do relógio, para as duas versões do loop
+BENCH_PHASES = ((0, BulletPattern(PatternType.SPIRAL, count=6, interval=0, speed=3, spin=11)),)
+WINDOWS = ((WIDTH, HEIGHT), (1600, 1200))
+
+def prepare(game, window):
+    game.render_target = RenderTarget((WIDTH, HEIGHT), 1.0, window, smooth=True)
+    game.screen = game.render_target.surface
+    random.seed(0)
+    game.reset_game()
+    # Sem spawns aleatórios nem rajadas de onda: as duas versões desenham a mesma cena
+    game.waves.cancel_wave_timers()
+    game.enemy_spawn_interval = 10 ** 9
+    game.boss_emitter = PatternEmitter(BENCH_PHASES)
+    game.player.take_damage = lambda amount, enemy=None: False
+    boss = Enemy(EnemyType.BOSS)
+    boss.rect.top = 40
+    boss.speed = 0
+    enemies = [boss]
+    for i in range(60):
+        enemy = Enemy(EnemyType.ASTEROID if i % 3 == 0 else EnemyType.COMMON)
+        enemy.rect.center = (40 + (i % 20) * 36, 180 + (i // 20) * 50)
+        enemy.speed = 0
+        enemies.append(enemy)
+    game.all_sprites.add(enemies)
+    game.enemies.add(enemies)
+
+def run_serial(game):
+    times = []
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        game.render(game.simulate(pygame.event.get()))
+        times.append(time.perf_counter() - start)
+    return times
+
+def run_pipelined(game):
+    times = []
+    frame = game.capture_frame()
+    with ThreadPoolExecutor(max_workers=1) as worker:
+        for _ in range(FRAMES):
+            start = time.perf_counter()
+            pending = worker.submit(game.simulate, pygame.event.get())
+            game.render(frame)
+            frame = pending.result()
+            times.append(time.perf_counter() - start)
+    return times
+
+def main():
+    game = AstroSmash()
+    print(f"núcleos de CPU: {os.cpu_count()}")
+    print(f"{'janela':>9} | {'modo':>10} | {'média':>9} | {'p95':>9} | {'sprites':>7}")
+    for window in WINDOWS:
+        for name, loop in (('serial', run_serial), ('pipeline', run_pipelined)):
+            prepare(game, window)
+            times = sorted(loop(game))
+            print(f"{window[0]:>4}x{window[1]:<4} | {name:>10} | {statistics.mean(times) * 1000:>6.2f} ms | "
+                  f"{times[int(len(times) * 0.95)] * 1000:>6.2f} ms | {len(game.all_sprites):>7}")
+
+if __name__ == "__main__":
+    main()
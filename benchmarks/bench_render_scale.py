@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from config import *
+from main import AstroSmash
+from game.entities.enemies import Enemy, EnemyType
+from game.entities.patterns import BulletPattern, PatternType
+from game.managers.render import RenderTarget
+
+WINDOW = (1600, 1200)
+SCALES = (0.5, 0.75, 1.0, 1.5, 2.0)
+FRAMES = 120
+
+def populate(game):
+    game.reset_game()
+    enemies = [Enemy(EnemyType.ASTEROID if i % 3 == 0 else EnemyType.COMMON) for i in range(40)]
+    for i, enemy in enumerate(enemies):
+        enemy.rect.center = (40 + i * 18, 100 + (i % 5) * 60)
+    game.all_sprites.add(enemies)
+    game.enemies.add(enemies)
+    pattern = BulletPattern(PatternType.RADIAL, count=400, interval=0)
+    game.boss_emitter.fire(pattern, (WIDTH // 2, HEIGHT // 2), game.player.rect.center,
+                           game.all_sprites, game.enemy_bullets)
+
+def measure(game, target):
+    game.render_target = target
+    game.screen = target.surface
+    frame = game.capture_frame()
+    game.draw(frame)
+    target.present()
+    draw_time = present_time = 0
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        game.draw(frame)
+        middle = time.perf_counter()
+        target.present()
+        pygame.display.flip()
+        end = time.perf_counter()
+        draw_time += middle - start
+        present_time += end - middle
+    return draw_time / FRAMES * 1000, present_time / FRAMES * 1000
+
+def main():
+    game = AstroSmash()
+    populate(game)
+    print(f"janela {WINDOW[0]}x{WINDOW[1]}, {len(game.all_sprites)} sprites")
+    print(f"{'escala':>6} | {'interna':>9} | {'filtro':>6} | {'desenho':>9} | {'apresentação':>12} | {'total':>9}")
+    for scale in SCALES:
+        for smooth in (False, True):
+            target = RenderTarget((WIDTH, HEIGHT), scale, WINDOW, smooth=smooth)
+            draw_ms, present_ms = measure(game, target)
+            size = f"{target.internal_size[0]}x{target.internal_size[1]}"
+            print(f"{scale:>6} | {size:>9} | {'smooth' if smooth else 'scale':>6} | {draw_ms:>6.2f} ms | "
+                  f"{present_ms:>9.2f} ms | {draw_ms + present_ms:>6.2f} ms")
+    try:
+        target = RenderTarget((WIDTH, HEIGHT), 1.0, hardware_scaling=True)
+        draw_ms, present_ms = measure(game, target)
+        print(f"{'SCALED':>6} | {WIDTH}x{HEIGHT} | {'SDL':>6} | {draw_ms:>6.2f} ms | "
+              f"{present_ms:>9.2f} ms | {draw_ms + present_ms:>6.2f} ms")
+    except pygame.error as e:
+        print(f"SCALED indisponível neste driver de vídeo: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import *
+from main import AstroSmash
+from game.entities.enemies import Enemy, EnemyType
+from game.entities.bullets import Bullet
+from game.entities.patterns import BulletPattern, PatternType
+
+ENTITY_COUNTS = (0, 50, 200, 1000, 4000)
+REPEAT = 200
+BATCHES = 5
+
+def populate(game, count):
+    game.reset_game()
+    enemies = count // 10
+    for i in range(enemies):
+        enemy = Enemy(EnemyType.ASTEROID if i % 3 == 0 else EnemyType.COMMON)
+        game.all_sprites.add(enemy)
+        game.enemies.add(enemy)
+    bullets = [Bullet(i % WIDTH, HEIGHT // 2) for i in range(count // 10)]
+    game.all_sprites.add(bullets)
+    game.bullets.add(bullets)
+    remaining = count - enemies - len(bullets)
+    if remaining:
+        pattern = BulletPattern(PatternType.RADIAL, count=remaining, interval=0)
+        game.boss_emitter.fire(pattern, (WIDTH // 2, HEIGHT // 2), game.player.rect.center,
+                               game.all_sprites, game.enemy_bullets)
+
+def timed(function, repeat):
+    # Melhor de BATCHES lotes: a média de um único lote oscila muito com a carga da máquina
+    best = float('inf')
+    for _ in range(BATCHES):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            function()
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best * 1_000_000
+
+def main():
+    game = AstroSmash()
+    snapshots = game.snapshots
+    print(f"{'entidades':>9} | {'tamanho':>10} | {'captura':>10} | {'restauração':>12} | {'push no anel':>12}")
+    for count in ENTITY_COUNTS:
+        populate(game, count)
+        data = snapshots.capture(game)
+        capture_us = timed(lambda: snapshots.capture(game), REPEAT)
+        restore_us = timed(lambda: snapshots.restore(game, data), max(10, REPEAT // 10))
+        push_us = timed(lambda: snapshots.push(game), REPEAT)
+        print(f"{count:>9} | {len(data):>8} B | {capture_us:>7.1f} us | {restore_us:>9.1f} us | {push_us:>9.1f} us")
+
+if __name__ == "__main__":
+    main()
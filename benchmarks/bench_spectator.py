@@ -0,0 +1,83 @@
+import asyncio
+import os
+import statistics
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import *
+from main import AstroSmash
+from game.entities.enemies import Enemy, EnemyType
+from game.network.client import SpectatorClient
+from game.network.server import SpectatorServer
+
+CLIENTS = (1, 4, 16)
+TICKS = 300
+
+def prepare_game():
+    game = AstroSmash()
+    game.reset_game()
+    game.player.take_damage = lambda amount, enemy=None: False
+    boss = Enemy(EnemyType.BOSS)
+    boss.rect.top = 40
+    boss.speed = 0
+    game.all_sprites.add(boss)
+    game.enemies.add(boss)
+    return game
+
+async def run(client_count):
+    game = prepare_game()
+    server = SpectatorServer(port=0)
+    await server.start()
+    clients = [SpectatorClient() for _ in range(client_count)]
+    for client in clients:
+        await client.connect(server.host, server.port)
+    while len(server.clients) < client_count:
+        await asyncio.sleep(0)
+    listeners = [asyncio.create_task(client.listen()) for client in clients]
+
+    full_sizes = []
+    delta_sizes = []
+    for _ in range(TICKS):
+        game.update()
+        snapshot, payload = server.encoder.encode(game)
+        full_sizes.append(len(snapshot.encode_full()))
+        delta_sizes.append(len(payload))
+        server.broadcast(snapshot, payload)
+        while any(client.decoder.tick < snapshot.tick for client in clients):
+            await asyncio.sleep(0)
+        await asyncio.sleep(1 / FPS)
+
+    consistent = all(client.decoder.entities == snapshot.entities for client in clients)
+    latencies = sorted(latency for client in clients for latency in client.latencies)
+    per_client = statistics.mean(client.bytes_received for client in clients) / TICKS
+
+    for listener in listeners:
+        listener.cancel()
+    for client in clients:
+        await client.close()
+    await server.stop()
+    return {
+        'entities': len(snapshot.entities),
+        'full': statistics.mean(full_sizes),
+        'delta': statistics.mean(delta_sizes),
+        'per_client': per_client,
+        'p50': latencies[len(latencies) // 2] / 1000,
+        'p99': latencies[int(len(latencies) * 0.99)] / 1000,
+        'consistent': consistent,
+    }
+
+def main():
+    print(f"{'clientes':>8} | {'entidades':>9} | {'completo':>10} | {'delta':>10} | "
+          f"{'B/tick/cliente':>14} | {'KiB/s/cliente':>13} | {'p50':>9} | {'p99':>9} | ok")
+    for client_count in CLIENTS:
+        result = asyncio.run(run(client_count))
+        print(f"{client_count:>8} | {result['entities']:>9} | {result['full']:>8.0f} B | {result['delta']:>8.0f} B | "
+              f"{result['per_client']:>14.0f} | {result['per_client'] * FPS / 1024:>13.1f} | "
+              f"{result['p50']:>6.0f} us | {result['p99']:>6.0f} us | {result['consistent']}")
+
+if __name__ == "__main__":
+    main()
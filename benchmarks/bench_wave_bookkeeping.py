@@ -0,0 +1,53 @@
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import AstroSmash
+from game.entities.enemies import Enemy, EnemyType
+
+ENEMY_COUNTS = (10, 100, 1000, 5000)
+REPEAT = 2000
+
+def legacy_bookkeeping(game):
+    # O que update/check_collisions faziam a cada tick antes do EnemyRegistry
+    game.boss_active = any(e.enemy_type == EnemyType.BOSS for e in game.enemies)
+    {'player_bullet': {EnemyType.BOSS: 3, EnemyType.ASTEROID: 2, EnemyType.COMMON: 1},
+     'enemy_collision': {EnemyType.BOSS: 6, EnemyType.ASTEROID: 4, EnemyType.COMMON: 2},
+     'enemy_bullet': 3}
+    {EnemyType.BOSS: 100, EnemyType.ASTEROID: 25, EnemyType.COMMON: 10}
+
+def indexed_bookkeeping(game):
+    game.enemies.count(EnemyType.BOSS)
+
+def timed(function, game):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        function(game)
+    return (time.perf_counter() - start) / REPEAT * 1_000_000
+
+def main():
+    game = AstroSmash()
+    game.reset_game()
+    print(f"{'inimigos':>8} | {'varredura antiga':>16} | {'registro indexado':>17} | {'add+kill':>10}")
+    for count in ENEMY_COUNTS:
+        game.enemies.empty()
+        enemies = [Enemy(EnemyType.ASTEROID if i % 3 == 0 else EnemyType.COMMON) for i in range(count)]
+        game.enemies.add(enemies)
+        legacy_us = timed(legacy_bookkeeping, game)
+        indexed_us = timed(indexed_bookkeeping, game)
+
+        extra = Enemy(EnemyType.COMMON)
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            game.enemies.add(extra)
+            extra.kill()
+        churn_us = (time.perf_counter() - start) / REPEAT * 1_000_000
+        print(f"{count:>8} | {legacy_us:>13.2f} us | {indexed_us:>14.2f} us | {churn_us:>7.2f} us")
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,16 @@ import pygame
 WIDTH, HEIGHT = 800, 600
 FPS = 60
 
+# Resolução interna = WIDTH x HEIGHT * RENDER_SCALE; a janela pode ter outro tamanho
+RENDER_SCALE = 1.0
+WINDOW_SIZE = (WIDTH, HEIGHT)
+FULLSCREEN = False
+SMOOTH_SCALING = True
+HARDWARE_SCALING = False
+
+# Simula o próximo tick numa thread enquanto a principal desenha o atual
+PIPELINED = False
+
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
 GREEN = (0, 255, 0)
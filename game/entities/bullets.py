@@ -1,31 +1,65 @@
 import pygame
+from pygame.math import Vector2
 from config import *
 
 class Bullet(pygame.sprite.Sprite):
+    shared_image = None
+
     def __init__(self, x, y):
         super().__init__()
-        self.image = pygame.Surface((4, 10), pygame.SRCALPHA)
-        pygame.draw.rect(self.image, YELLOW, (0, 0, 4, 10))
+        if Bullet.shared_image is None:
+            Bullet.shared_image = pygame.Surface((4, 10), pygame.SRCALPHA)
+            pygame.draw.rect(Bullet.shared_image, YELLOW, (0, 0, 4, 10))
+        self.image = Bullet.shared_image
         self.rect = self.image.get_rect(center=(x, y))
         self.speed = 10
-        
+
     def update(self):
         self.rect.y -= self.speed
         if self.rect.bottom < 0:
             self.kill()
 
 class EnemyBullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, angle):
+    # Uma única surface compartilhada por todas as balas inimigas
+    shared_image = None
+    shared_rect = None
+
+    def __init__(self, x, y, angle=0, direction=None, speed=3):
         super().__init__()
-        self.image = pygame.Surface((8, 8), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, ORANGE, (4, 4), 4)
+        self.image = EnemyBullet.get_shared_image()
         self.rect = self.image.get_rect(center=(x, y))
-        self.speed = 3
+        self.x = float(x)
+        self.y = float(y)
+        self.speed = speed
         self.angle = angle
-        self.direction = Vector2(1, 0).rotate(-angle)
-        
+        self.direction = direction if direction is not None else Vector2(1, 0).rotate(-angle)
+        self.vx = self.direction[0] * speed
+        self.vy = self.direction[1] * speed
+
+    @classmethod
+    def get_shared_image(cls):
+        if cls.shared_image is None:
+            cls.shared_image = pygame.Surface((8, 8), pygame.SRCALPHA)
+            pygame.draw.circle(cls.shared_image, ORANGE, (4, 4), 4)
+            cls.shared_rect = cls.shared_image.get_rect()
+        return cls.shared_image
+
+    @classmethod
+    def from_table(cls, x, y, speed, entry):
+        # Caminho rápido para rajadas: ângulo, direção e velocidade já vêm da tabela do padrão
+        bullet = cls.__new__(cls)
+        pygame.sprite.Sprite.__init__(bullet)
+        bullet.image = cls.get_shared_image()
+        bullet.rect = cls.shared_rect.move(int(x) - 4, int(y) - 4)
+        bullet.x = float(x)
+        bullet.y = float(y)
+        bullet.speed = speed
+        bullet.angle, bullet.direction, bullet.vx, bullet.vy = entry
+        return bullet
+
     def update(self):
-        self.rect.x += self.direction.x * self.speed
-        self.rect.y += self.direction.y * self.speed
+        self.x += self.vx
+        self.y += self.vy
+        self.rect.center = (self.x, self.y)
         if not (0 <= self.rect.x <= WIDTH and 0 <= self.rect.y <= HEIGHT):
-            self.kill()
\ No newline at end of file
+            self.kill()
@@ -9,7 +9,16 @@ class EnemyType(Enum):
     ASTEROID = 2
     BOSS = 3
 
+ENEMY_DAMAGE = {
+    EnemyType.BOSS: 150,
+    EnemyType.ASTEROID: 25,
+    EnemyType.COMMON: 13
+}
+
 class Enemy(pygame.sprite.Sprite):
+    # Frames carregados uma vez por tipo e compartilhados entre instâncias
+    frame_cache = {}
+
     def __init__(self, enemy_type=EnemyType.COMMON):
         super().__init__()
         self.enemy_type = enemy_type
@@ -26,16 +35,14 @@ class Enemy(pygame.sprite.Sprite):
     def _setup_attributes(self):
         if self.enemy_type == EnemyType.BOSS:
             self.health = 80
-            self.damage = 150
             self.speed = random.uniform(0.8, 0.8)
         elif self.enemy_type == EnemyType.ASTEROID:
             self.health = 10
-            self.damage = 25
             self.speed = random.uniform(1.5, 2.5)
         else:
             self.health = 1
-            self.damage = 13
             self.speed = random.uniform(2.0, 3.0)
+        self.damage = ENEMY_DAMAGE[self.enemy_type]
         self.shield = 0
 
     def get_initial_position(self):
@@ -68,6 +75,8 @@ class Enemy(pygame.sprite.Sprite):
         return surface
 
     def load_animation_frames(self):
+        if self.enemy_type in Enemy.frame_cache:
+            return Enemy.frame_cache[self.enemy_type]
         frames = []
         folder = self.get_sprite_folder()
         sprite_path = os.path.join('assets', 'sprites', folder)
@@ -82,7 +91,9 @@ class Enemy(pygame.sprite.Sprite):
                 frames.append(pygame.transform.scale(frame, size))
         except Exception as e:
             print(f"Erro ao carregar sprites do inimigo: {e}")
-        return frames or [self.create_fallback_image()]
+        frames = frames or [self.create_fallback_image()]
+        Enemy.frame_cache[self.enemy_type] = frames
+        return frames
 
     def update(self):
         now = pygame.time.get_ticks()
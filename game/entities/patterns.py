@@ -0,0 +1,96 @@
+import math
+from enum import Enum
+from config import *
+from game.entities.bullets import EnemyBullet
+
+# Tabela de direções pré-calculada: nenhuma trigonometria por bala
+DIRECTION_STEPS = 360
+DIRECTION_TABLE = tuple(
+    (math.cos(math.radians(i * 360 / DIRECTION_STEPS)), -math.sin(math.radians(i * 360 / DIRECTION_STEPS)))
+    for i in range(DIRECTION_STEPS)
+)
+DOWN = DIRECTION_STEPS * 3 // 4
+
+class PatternType(Enum):
+    RADIAL = 1
+    SPIRAL = 2
+    AIMED = 3
+
+class BulletPattern:
+    def __init__(self, pattern_type, count, interval, speed=3, spread=360, spin=0):
+        self.pattern_type = pattern_type
+        self.count = count
+        self.interval = interval
+        self.speed = speed
+        self.spread = spread
+        self.spin = spin
+        self.offsets = self.build_offsets()
+        # (ângulo, direção, vx, vy) por índice da tabela; a velocidade é fixa por padrão
+        self.velocity_table = tuple(
+            (i * 360 / DIRECTION_STEPS, direction, direction[0] * speed, direction[1] * speed)
+            for i, direction in enumerate(DIRECTION_TABLE)
+        )
+
+    def build_offsets(self):
+        steps = self.spread * DIRECTION_STEPS // 360
+        if steps >= DIRECTION_STEPS:
+            return tuple(i * DIRECTION_STEPS // self.count for i in range(self.count))
+        if self.count == 1:
+            return (0,)
+        return tuple(-steps // 2 + i * steps // (self.count - 1) for i in range(self.count))
+
+# Fases do chefe: (vida mínima, padrão)
+BOSS_PHASES = (
+    (54, BulletPattern(PatternType.RADIAL, count=24, interval=900, speed=3)),
+    (27, BulletPattern(PatternType.SPIRAL, count=6, interval=120, speed=3, spin=11)),
+    (0, BulletPattern(PatternType.AIMED, count=9, interval=500, speed=4, spread=60)),
+)
+
+class PatternEmitter:
+    def __init__(self, phases=BOSS_PHASES):
+        self.phases = phases
+        self.last_volley = 0
+        self.rotation = 0
+
+    def reset(self):
+        self.last_volley = 0
+        self.rotation = 0
+
+    def get_pattern(self, health):
+        for min_health, pattern in self.phases:
+            if health > min_health:
+                return pattern
+        return self.phases[-1][1]
+
+    def aim_index(self, origin, target):
+        dx = target[0] - origin[0]
+        dy = target[1] - origin[1]
+        if dx == 0 and dy == 0:
+            return DOWN
+        return round(math.degrees(math.atan2(-dy, dx)) * DIRECTION_STEPS / 360) % DIRECTION_STEPS
+
+    def update(self, boss, target, now, all_sprites, enemy_bullets):
+        pattern = self.get_pattern(boss.health)
+        if now - self.last_volley < pattern.interval:
+            return []
+        self.last_volley = now
+        return self.fire(pattern, boss.rect.center, target, all_sprites, enemy_bullets)
+
+    def fire(self, pattern, origin, target, all_sprites, enemy_bullets):
+        if pattern.pattern_type == PatternType.AIMED:
+            base = self.aim_index(origin, target)
+        elif pattern.pattern_type == PatternType.SPIRAL:
+            self.rotation = (self.rotation + pattern.spin) % DIRECTION_STEPS
+            base = self.rotation
+        else:
+            base = 0
+
+        x, y = origin
+        speed = pattern.speed
+        table = pattern.velocity_table
+        spawn = EnemyBullet.from_table
+        volley = [spawn(x, y, speed, table[(base + offset) % DIRECTION_STEPS]) for offset in pattern.offsets]
+
+        all_sprites.add(volley)
+        enemy_bullets.add(volley)
+        return volley
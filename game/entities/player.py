@@ -70,15 +70,14 @@ class Player(pygame.sprite.Sprite):
             self.image = self.frames[self.current_frame]
             self.original_image = self.image.copy()
             
-            if self.invincible:
-                if (now // 100) % 2 == 0:
-                    self.image.set_alpha(100)
-                else:
-                    self.image.set_alpha(255)
+            # Pisca numa cópia: os frames são compartilhados com o quadro sendo desenhado
+            if self.invincible and (now // 100) % 2 == 0:
+                self.image = self.original_image
+                self.image.set_alpha(100)
         
         if self.invincible and now - self.invincible_timer > self.invincible_duration:
             self.invincible = False
-            self.image.set_alpha(255)
+            self.image = self.frames[self.current_frame]
         
         keys = pygame.key.get_pressed()
         is_moving = False
@@ -0,0 +1,27 @@
+import pygame
+from game.entities.enemies import EnemyType
+
+class EnemyRegistry(pygame.sprite.Group):
+    # Grupo de inimigos indexado por tipo; contagens e eventos mantidos em add/kill
+    def __init__(self, *sprites):
+        self.by_type = {enemy_type: {} for enemy_type in EnemyType}
+        self.listeners = []
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.by_type[sprite.enemy_type][sprite] = None
+        for listener in self.listeners:
+            listener.on_enemy_added(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        del self.by_type[sprite.enemy_type][sprite]
+        for listener in self.listeners:
+            listener.on_enemy_removed(sprite)
+
+    def count(self, enemy_type):
+        return len(self.by_type[enemy_type])
+
+    def of_type(self, enemy_type):
+        return self.by_type[enemy_type].keys()
@@ -0,0 +1,124 @@
+import pygame
+
+MAX_SCALED_IMAGES = 512
+
+class RenderTarget:
+    # O jogo desenha em coordenadas lógicas (WIDTH x HEIGHT) numa surface fora da tela
+    # com resolução interna configurável, apresentada depois na janela.
+    def __init__(self, logical_size, render_scale=1.0, window_size=None, fullscreen=False,
+                 smooth=True, hardware_scaling=False):
+        self.logical_size = logical_size
+        self.scale = render_scale
+        self.internal_size = (max(1, round(logical_size[0] * render_scale)),
+                              max(1, round(logical_size[1] * render_scale)))
+        self.smooth = smooth
+        self.hardware_scaling = hardware_scaling
+        self.scaled_images = {}
+
+        if hardware_scaling:
+            # SDL escala a surface interna até a janela e já devolve o mouse em coordenadas internas
+            flags = pygame.SCALED | (pygame.FULLSCREEN if fullscreen else 0)
+            self.display = pygame.display.set_mode(self.internal_size, flags)
+            self.surface = self.display
+        else:
+            flags = pygame.FULLSCREEN if fullscreen else 0
+            self.display = pygame.display.set_mode((0, 0) if fullscreen else (window_size or logical_size), flags)
+            if self.internal_size == self.display.get_size():
+                self.surface = self.display
+            else:
+                self.surface = pygame.Surface(self.internal_size).convert()
+                self.display.fill((0, 0, 0))
+        self.viewport = self.compute_viewport()
+
+    def compute_viewport(self):
+        if self.surface is self.display:
+            return self.display.get_rect()
+        window_width, window_height = self.display.get_size()
+        fit = min(window_width / self.internal_size[0], window_height / self.internal_size[1])
+        viewport = pygame.Rect(0, 0, round(self.internal_size[0] * fit), round(self.internal_size[1] * fit))
+        viewport.center = (window_width // 2, window_height // 2)
+        return viewport
+
+    def point(self, x, y):
+        return (round(x * self.scale), round(y * self.scale))
+
+    def length(self, value):
+        return max(1, round(value * self.scale))
+
+    def rect(self, x, y, width, height):
+        return pygame.Rect(round(x * self.scale), round(y * self.scale),
+                           round(width * self.scale), round(height * self.scale))
+
+    def scaled_image(self, image):
+        # A cópia escalada herda o alpha da surface, que pode mudar sem trocar de objeto
+        key = (image, image.get_alpha())
+        scaled = self.scaled_images.get(key)
+        if scaled is None:
+            # Cópias temporárias (ex.: inimigo piscando ao ser atingido) não podem acumular
+            if len(self.scaled_images) >= MAX_SCALED_IMAGES:
+                self.scaled_images.clear()
+            width, height = image.get_size()
+            scaled = pygame.transform.scale(image, (self.length(width), self.length(height)))
+            self.scaled_images[key] = scaled
+        return scaled
+
+    def draw_sprites(self, sprites):
+        if self.scale == 1:
+            self.surface.blits(sprites, False)
+            return
+        scale = self.scale
+        blits = []
+        for image, (x, y) in sprites:
+            scaled = self.scaled_image(image)
+            blits.append((scaled, (int(x * scale), int(y * scale))))
+        self.surface.blits(blits, False)
+
+    def present(self):
+        if self.surface is self.display:
+            return
+        if self.viewport.size == self.internal_size:
+            self.display.blit(self.surface, self.viewport)
+            return
+        target = self.display.subsurface(self.viewport)
+        if self.smooth:
+            pygame.transform.smoothscale(self.surface, self.viewport.size, target)
+        else:
+            pygame.transform.scale(self.surface, self.viewport.size, target)
+
+    def to_logical(self, pos):
+        x = (pos[0] - self.viewport.x) * self.internal_size[0] / self.viewport.width
+        y = (pos[1] - self.viewport.y) * self.internal_size[1] / self.viewport.height
+        return (int(x / self.scale), int(y / self.scale))
+
+class RenderFrame:
+    # Tudo que draw() precisa de um tick, copiado da simulação para que o desenho
+    # nunca leia o estado vivo do jogo (ver AstroSmash.run_pipelined)
+    def __init__(self):
+        self.sprites = []
+        self.game_state = None
+        self.score = 0
+        self.high_score = 0
+        self.wave = 1
+        self.health = 0
+        self.shield = 0
+        self.heat = 0
+        self.boss_active = False
+        self.show_wave_message = False
+        self.wave_transition_start = 0
+
+    def capture(self, game):
+        self.sprites.clear()
+        self.sprites.extend((sprite.image, sprite.rect.topleft) for sprite in game.all_sprites)
+        score_manager = game.score_manager
+        player = game.player
+        self.game_state = game.game_state
+        self.score = score_manager.score
+        self.high_score = score_manager.high_score
+        self.wave = score_manager.wave
+        self.health = player.health
+        self.shield = player.shield
+        self.heat = player.heat
+        self.boss_active = game.boss_active
+        self.show_wave_message = game.show_wave_message
+        self.wave_transition_start = game.wave_transition_start
+        return self
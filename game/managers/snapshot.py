@@ -0,0 +1,212 @@
+import os
+import random
+import struct
+import pygame
+from collections import deque
+from game.entities.enemies import Enemy, EnemyType, ENEMY_DAMAGE
+from game.entities.bullets import Bullet, EnemyBullet
+
+MAGIC = b'ASNP'
+VERSION = 1
+
+# Tempos baseados em get_ticks() são gravados relativos ao instante da captura,
+# assim um snapshot continua válido em outra execução do jogo.
+GAME = struct.Struct('<4sBB??IIHIIiiiiiHI')
+PLAYER = struct.Struct('<hhhhfB?iiii')
+ENTITY = struct.Struct('<BBBBffffffhhi')
+RNG = struct.Struct('<625I?d')
+
+KIND_PLAYER_BULLET = 1
+KIND_ENEMY_BULLET = 2
+KIND_ENEMY = 3
+
+class SnapshotManager:
+    def __init__(self, capacity=180, save_path='savestate.dat', save_interval=1000):
+        self.ring = deque(maxlen=capacity)
+        self.save_path = save_path
+        self.save_interval = save_interval
+        self.last_save = 0
+
+    def capture(self, game):
+        now = pygame.time.get_ticks()
+        score_manager = game.score_manager
+        emitter = game.boss_emitter
+        player = game.player
+
+        entities = []
+        for sprite in game.all_sprites:
+            if sprite is player:
+                continue
+            if isinstance(sprite, Enemy):
+                entities.append(ENTITY.pack(KIND_ENEMY, sprite.enemy_type.value, sprite.hit, sprite.current_frame,
+                                            sprite.rect.x, sprite.rect.y, 0, 0, sprite.speed, 0,
+                                            sprite.health, sprite.hit_timer, sprite.last_update - now))
+            elif isinstance(sprite, EnemyBullet):
+                entities.append(ENTITY.pack(KIND_ENEMY_BULLET, 0, 0, 0, sprite.x, sprite.y,
+                                            sprite.vx, sprite.vy, sprite.speed, sprite.angle, 0, 0, 0))
+            elif isinstance(sprite, Bullet):
+                entities.append(ENTITY.pack(KIND_PLAYER_BULLET, 0, 0, 0, sprite.rect.x, sprite.rect.y,
+                                            0, 0, sprite.speed, 0, 0, 0, 0))
+
+        version, state, gauss_next = random.getstate()
+        parts = [
+            GAME.pack(MAGIC, VERSION, game.game_state, game.boss_active, game.show_wave_message,
+                      score_manager.score, score_manager.high_score, score_manager.wave,
+                      game.enemies_defeated, game.enemies_per_wave, game.enemy_spawn_interval,
+                      game.splash_time - now, game.last_enemy_spawn - now, game.wave_transition_start - now,
+                      emitter.last_volley - now, emitter.rotation, len(entities)),
+            PLAYER.pack(player.rect.x, player.rect.y, player.health, player.shield, player.heat,
+                        player.current_frame, player.invincible, player.last_shot - now,
+                        player.invincible_timer - now, player.last_update - now, player.last_movement_sound - now),
+            RNG.pack(*state, gauss_next is not None, gauss_next or 0.0),
+        ]
+        parts.extend(entities)
+        return b''.join(parts)
+
+    def restore(self, game, data):
+        now = pygame.time.get_ticks()
+        if len(data) < GAME.size:
+            raise ValueError("Snapshot truncado")
+        (magic, version, game_state, boss_active, show_wave_message, score, high_score, wave,
+         enemies_defeated, enemies_per_wave, enemy_spawn_interval, splash_time, last_enemy_spawn,
+         wave_transition_start, last_volley, rotation, entity_count) = GAME.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Snapshot inválido ou de versão incompatível")
+        if len(data) != GAME.size + PLAYER.size + RNG.size + entity_count * ENTITY.size:
+            raise ValueError("Snapshot truncado ou corrompido")
+
+        # Decodifica tudo antes de tocar no jogo: um arquivo ruim não pode deixar um estado pela metade
+        offset = GAME.size
+        (x, y, health, shield, heat, current_frame, invincible, last_shot,
+         invincible_timer, player_last_update, last_movement_sound) = PLAYER.unpack_from(data, offset)
+        offset += PLAYER.size
+        rng = RNG.unpack_from(data, offset)
+        offset += RNG.size
+        records = []
+        for record in ENTITY.iter_unpack(memoryview(data)[offset:]):
+            kind = record[0]
+            if kind == KIND_ENEMY:
+                record = (kind, EnemyType(record[1])) + record[2:]
+            elif kind not in (KIND_ENEMY_BULLET, KIND_PLAYER_BULLET):
+                raise ValueError(f"Tipo de entidade desconhecido no snapshot: {kind}")
+            records.append(record)
+
+        game.game_state = game_state
+        game.boss_active = boss_active
+        game.show_wave_message = show_wave_message
+        # O recorde é persistido em highscore.dat e não volta no tempo com o snapshot
+        game.score_manager.score = score
+        game.score_manager.wave = wave
+        game.enemies_defeated = enemies_defeated
+        game.enemies_per_wave = enemies_per_wave
+        game.enemy_spawn_interval = enemy_spawn_interval
+        game.splash_time = now + splash_time
+        game.last_enemy_spawn = now + last_enemy_spawn
+        game.wave_transition_start = now + wave_transition_start
+        game.boss_emitter.last_volley = now + last_volley
+        game.boss_emitter.rotation = rotation
+
+        player = game.player
+        player.health = health
+        player.shield = shield
+        player.heat = heat
+        player.invincible = invincible
+        player.current_frame = current_frame % len(player.frames)
+        player.image = player.frames[player.current_frame]
+        player.rect.topleft = (x, y)
+        player.last_shot = now + last_shot
+        player.invincible_timer = now + invincible_timer
+        player.last_update = now + player_last_update
+        player.last_movement_sound = now + last_movement_sound
+
+        game.all_sprites.empty()
+        game.enemies.empty()
+        game.bullets.empty()
+        game.enemy_bullets.empty()
+
+        enemies = []
+        bullets = []
+        enemy_bullets = []
+        ordered = [player]
+        for kind, subtype, hit, current_frame, x, y, vx, vy, speed, angle, health, hit_timer, last_update in records:
+            if kind == KIND_ENEMY:
+                sprite = self.build_enemy(subtype, x, y, speed, health, hit, hit_timer,
+                                          current_frame, now + last_update)
+                enemies.append(sprite)
+            elif kind == KIND_ENEMY_BULLET:
+                direction = (vx / speed, vy / speed) if speed else (0, 0)
+                sprite = EnemyBullet.from_table(x, y, speed, (angle, direction, vx, vy))
+                enemy_bullets.append(sprite)
+            else:
+                sprite = Bullet(0, 0)
+                sprite.rect.topleft = (x, y)
+                sprite.speed = speed
+                bullets.append(sprite)
+            ordered.append(sprite)
+
+        game.all_sprites.add(ordered)
+        game.enemies.add(enemies)
+        game.bullets.add(bullets)
+        game.enemy_bullets.add(enemy_bullets)
+
+        random.setstate((3, rng[:625], rng[626] if rng[625] else None))
+
+    def build_enemy(self, enemy_type, x, y, speed, health, hit, hit_timer, current_frame, last_update):
+        # Sem o construtor: ele sortearia posição e velocidade só para serem sobrescritas
+        enemy = Enemy.__new__(Enemy)
+        pygame.sprite.Sprite.__init__(enemy)
+        enemy.enemy_type = enemy_type
+        frames = Enemy.frame_cache.get(enemy_type) or enemy.load_animation_frames()
+        enemy.frames = frames
+        enemy.current_frame = current_frame % len(frames)
+        enemy.animation_speed = enemy.get_animation_speed()
+        enemy.last_update = last_update
+        enemy.image = frames[enemy.current_frame]
+        enemy.rect = enemy.image.get_rect(topleft=(int(x), int(y)))
+        enemy.health = health
+        enemy.damage = ENEMY_DAMAGE[enemy_type]
+        enemy.speed = speed
+        enemy.shield = 0
+        enemy.hit = hit
+        enemy.hit_timer = hit_timer
+        return enemy
+
+    def push(self, game):
+        data = self.capture(game)
+        self.ring.append(data)
+        return data
+
+    def rewind(self, game, steps):
+        if not self.ring:
+            return False
+        for _ in range(min(steps, len(self.ring) - 1)):
+            self.ring.pop()
+        self.restore(game, self.ring[-1])
+        return True
+
+    def autosave(self, now):
+        if not self.ring or now - self.last_save < self.save_interval:
+            return False
+        self.last_save = now
+        # Grava num temporário e troca atomicamente: um crash no meio nunca trunca o único save
+        temp_path = self.save_path + '.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(self.ring[-1])
+            os.replace(temp_path, self.save_path)
+            return True
+        except OSError as e:
+            print(f"Erro ao salvar snapshot: {e}")
+            return False
+
+    def load(self, game):
+        try:
+            with open(self.save_path, 'rb') as f:
+                data = f.read()
+            self.restore(game, data)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Erro ao carregar snapshot: {e}")
+            return False
+        self.ring.clear()
+        self.ring.append(data)
+        return True
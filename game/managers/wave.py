@@ -0,0 +1,92 @@
+import random
+import pygame
+from game.entities.enemies import EnemyType
+
+MAX_WAVE_TIMERS = 50
+BOSS_WAVE_EVERY = 5
+
+class WaveController:
+    # Único ponto de progressão de ondas: reage a eventos de spawn e morte do EnemyRegistry
+    def __init__(self, game):
+        self.game = game
+        game.enemies.listeners.append(self)
+
+    def reset(self):
+        game = self.game
+        self.cancel_wave_timers()
+        game.enemies_defeated = 0
+        game.enemies_per_wave = 1
+        game.enemy_spawn_interval = 1000
+        game.last_enemy_spawn = pygame.time.get_ticks()
+        game.show_wave_message = False
+
+    def is_boss_wave(self):
+        return self.game.score_manager.wave % BOSS_WAVE_EVERY == 0
+
+    def on_enemy_added(self, enemy):
+        if enemy.enemy_type == EnemyType.BOSS:
+            self.game.boss_active = True
+
+    def on_enemy_removed(self, enemy):
+        if enemy.enemy_type == EnemyType.BOSS and self.game.enemies.count(EnemyType.BOSS) == 0:
+            self.game.boss_active = False
+
+    def on_enemy_defeated(self, enemy):
+        game = self.game
+        game.enemies_defeated += 1
+        if game.enemies_defeated >= game.enemies_per_wave and not game.boss_active:
+            self.advance_wave()
+
+    def on_enemy_spawned(self, now):
+        game = self.game
+        game.last_enemy_spawn = now
+        if random.random() < 0.2:
+            game.enemy_spawn_interval = max(200, game.enemy_spawn_interval - 30)
+            if game.enemy_spawn_interval <= 300:
+                self.advance_wave(burst=False)
+
+    def update(self, now):
+        game = self.game
+        if (now - game.last_enemy_spawn > game.enemy_spawn_interval and
+                len(game.enemies) < 5 + game.score_manager.wave):
+            game.spawn_enemy()
+            self.on_enemy_spawned(now)
+
+        if game.show_wave_message and now - game.wave_transition_start > 2000:
+            game.show_wave_message = False
+
+    def advance_wave(self, burst=True):
+        game = self.game
+        game.score_manager.increase_wave()
+        if not burst:
+            # Onda vencida pela rampa de spawn: sem rajada nem reinício da cota de abates
+            now = pygame.time.get_ticks()
+            game.enemy_spawn_interval = 800
+            game.show_wave_message = True
+            game.wave_transition_start = now
+            return
+        game.enemies_defeated = 0
+        game.enemies_per_wave = 15 + game.score_manager.wave * 2
+        self.start_wave()
+
+    def start_wave(self):
+        game = self.game
+        wave = game.score_manager.wave
+        base_enemies = min(MAX_WAVE_TIMERS, 8 + wave * 2)
+        min_interval = max(200, 800 - wave * 30)
+
+        self.cancel_wave_timers()
+        for i in range(base_enemies):
+            pygame.time.set_timer(pygame.USEREVENT + i, i * min_interval + 1, True)
+
+        now = pygame.time.get_ticks()
+        game.enemy_spawn_interval = min_interval * 2
+        game.last_enemy_spawn = now
+        game.show_wave_message = True
+        game.wave_transition_start = now
+        if game.audio_manager.has_sound and 'wave' in game.audio_manager.sounds:
+            game.audio_manager.play_sound('wave')
+
+    def cancel_wave_timers(self):
+        for i in range(MAX_WAVE_TIMERS):
+            pygame.time.set_timer(pygame.USEREVENT + i, 0)
@@ -0,0 +1,93 @@
+import asyncio
+import sys
+import time
+import pygame
+from collections import deque
+from config import *
+from game.network.protocol import EntityKind, StateDecoder, LENGTH
+from game.network.server import DEFAULT_HOST, DEFAULT_PORT
+
+ENTITY_STYLES = {
+    EntityKind.PLAYER: (GREEN, 15),
+    EntityKind.COMMON: (RED, 15),
+    EntityKind.ASTEROID: (GRAY, 15),
+    EntityKind.BOSS: (PURPLE, 60),
+    EntityKind.BULLET: (YELLOW, 3),
+    EntityKind.ENEMY_BULLET: (ORANGE, 4),
+}
+
+class SpectatorClient:
+    def __init__(self):
+        self.decoder = StateDecoder()
+        self.reader = None
+        self.writer = None
+        self.bytes_received = 0
+        self.frames_received = 0
+        self.latencies = deque(maxlen=1000)
+
+    async def connect(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+
+    async def close(self):
+        if self.writer:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+            self.writer = None
+
+    async def receive(self):
+        header = await self.reader.readexactly(LENGTH.size)
+        payload = await self.reader.readexactly(LENGTH.unpack(header)[0])
+        self.bytes_received += LENGTH.size + len(payload)
+        self.frames_received += 1
+        if self.decoder.apply(payload):
+            # Relógio monotônico compartilhado: só faz sentido na mesma máquina
+            self.latencies.append(time.perf_counter_ns() - self.decoder.sent_ns)
+        return self.decoder
+
+    async def listen(self):
+        try:
+            while True:
+                await self.receive()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+    def render(self, surface, font):
+        surface.fill(BLACK)
+        for kind, x, y in self.decoder.entities.values():
+            color, radius = ENTITY_STYLES.get(kind, (WHITE, 4))
+            pygame.draw.circle(surface, color, (x, y), radius)
+        decoder = self.decoder
+        hud = f"Pontuação: {decoder.score}  Nível: {decoder.wave}  Vida: {decoder.health}  Escudo: {decoder.shield}"
+        surface.blit(font.render(hud, True, WHITE), (10, 10))
+        if self.latencies:
+            latency_ms = self.latencies[-1] / 1_000_000
+            stats = f"Latência: {latency_ms:.2f} ms  Recebido: {self.bytes_received / 1024:.1f} KiB"
+            surface.blit(font.render(stats, True, GRAY), (10, HEIGHT - 30))
+
+async def run_viewer(host, port):
+    pygame.init()
+    pygame.display.set_caption("AstroSmash - Espectador")
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    font = pygame.font.Font(None, 28)
+    client = SpectatorClient()
+    await client.connect(host, port)
+    listener = asyncio.create_task(client.listen())
+    running = True
+    while running and not listener.done():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+        client.render(screen, font)
+        pygame.display.flip()
+        await asyncio.sleep(1 / FPS)
+    listener.cancel()
+    await client.close()
+    pygame.quit()
+
+if __name__ == "__main__":
+    host = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_HOST
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_PORT
+    asyncio.run(run_viewer(host, port))
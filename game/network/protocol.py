@@ -0,0 +1,158 @@
+import struct
+import time
+from itertools import count
+from enum import IntEnum
+from game.entities.enemies import EnemyType
+
+class MessageType(IntEnum):
+    FULL = 1
+    DELTA = 2
+
+class EntityKind(IntEnum):
+    PLAYER = 0
+    COMMON = 1
+    ASTEROID = 2
+    BOSS = 3
+    BULLET = 4
+    ENEMY_BULLET = 5
+
+ENEMY_KINDS = {
+    EnemyType.COMMON: EntityKind.COMMON,
+    EnemyType.ASTEROID: EntityKind.ASTEROID,
+    EnemyType.BOSS: EntityKind.BOSS,
+}
+
+# tipo, tick, enviado (ns), estado do jogo, pontuação, onda, vida, escudo, novos, movidos, removidos
+HEADER = struct.Struct('<BIQBIHBBHHH')
+ENTITY = struct.Struct('<IBhh')
+MOVED = struct.Struct('<Ibb')
+REMOVED = struct.Struct('<I')
+LENGTH = struct.Struct('<I')
+
+def quantize(value):
+    return max(-32768, min(32767, int(value)))
+
+def frame(payload):
+    return LENGTH.pack(len(payload)) + payload
+
+class Snapshot:
+    def __init__(self, tick, game_state, score, wave, health, shield, entities):
+        self.tick = tick
+        self.game_state = game_state
+        self.score = score
+        self.wave = wave
+        self.health = health
+        self.shield = shield
+        self.entities = entities
+
+    def header(self, message_type, sent_ns, changed, moved, removed):
+        return HEADER.pack(message_type, self.tick, sent_ns, self.game_state, self.score, self.wave,
+                           self.health, self.shield, changed, moved, removed)
+
+    def encode_full(self, sent_ns=None):
+        sent_ns = time.perf_counter_ns() if sent_ns is None else sent_ns
+        parts = [self.header(MessageType.FULL, sent_ns, len(self.entities), 0, 0)]
+        parts.extend(ENTITY.pack(net_id, *record) for net_id, record in self.entities.items())
+        return b''.join(parts)
+
+    def encode_delta(self, previous, sent_ns=None):
+        sent_ns = time.perf_counter_ns() if sent_ns is None else sent_ns
+        old = previous.entities
+        changed = []
+        moved = []
+        for net_id, record in self.entities.items():
+            old_record = old.get(net_id)
+            if old_record == record:
+                continue
+            # Entidades que só andaram poucos pixels viajam como deslocamento de 1 byte por eixo
+            if old_record is not None and old_record[0] == record[0]:
+                dx = record[1] - old_record[1]
+                dy = record[2] - old_record[2]
+                if -128 <= dx <= 127 and -128 <= dy <= 127:
+                    moved.append(MOVED.pack(net_id, dx, dy))
+                    continue
+            changed.append(ENTITY.pack(net_id, *record))
+        removed = [REMOVED.pack(net_id) for net_id in old if net_id not in self.entities]
+        header = self.header(MessageType.DELTA, sent_ns, len(changed), len(moved), len(removed))
+        return b''.join([header] + changed + moved + removed)
+
+class StateEncoder:
+    def __init__(self):
+        self.ids = count(1)
+        self.tick = 0
+        self.previous = None
+
+    def net_id(self, sprite):
+        net_id = getattr(sprite, 'net_id', None)
+        if net_id is None:
+            net_id = sprite.net_id = next(self.ids)
+        return net_id
+
+    def capture(self, game):
+        entities = {}
+        player = game.player
+        entities[self.net_id(player)] = (EntityKind.PLAYER, quantize(player.rect.centerx), quantize(player.rect.centery))
+        for enemy in game.enemies:
+            entities[self.net_id(enemy)] = (ENEMY_KINDS[enemy.enemy_type], quantize(enemy.rect.centerx), quantize(enemy.rect.centery))
+        for bullet in game.bullets:
+            entities[self.net_id(bullet)] = (EntityKind.BULLET, quantize(bullet.rect.centerx), quantize(bullet.rect.centery))
+        for bullet in game.enemy_bullets:
+            entities[self.net_id(bullet)] = (EntityKind.ENEMY_BULLET, quantize(bullet.rect.centerx), quantize(bullet.rect.centery))
+
+        self.tick += 1
+        score_manager = game.score_manager
+        return Snapshot(self.tick, game.game_state, score_manager.score, score_manager.wave,
+                        int(player.health), int(player.shield), entities)
+
+    def encode(self, game):
+        snapshot = self.capture(game)
+        if self.previous is None:
+            payload = snapshot.encode_full()
+        else:
+            payload = snapshot.encode_delta(self.previous)
+        self.previous = snapshot
+        return snapshot, payload
+
+class StateDecoder:
+    def __init__(self):
+        self.entities = {}
+        self.tick = 0
+        self.game_state = 0
+        self.score = 0
+        self.wave = 1
+        self.health = 0
+        self.shield = 0
+        self.sent_ns = 0
+        self.synced = False
+
+    def apply(self, payload):
+        (message_type, tick, sent_ns, game_state, score, wave,
+         health, shield, changed, moved, removed) = HEADER.unpack_from(payload, 0)
+        if message_type == MessageType.DELTA and not self.synced:
+            return False
+        if message_type == MessageType.FULL:
+            self.entities = {}
+            self.synced = True
+
+        offset = HEADER.size
+        for _ in range(changed):
+            net_id, kind, x, y = ENTITY.unpack_from(payload, offset)
+            self.entities[net_id] = (kind, x, y)
+            offset += ENTITY.size
+        for _ in range(moved):
+            net_id, dx, dy = MOVED.unpack_from(payload, offset)
+            kind, x, y = self.entities[net_id]
+            self.entities[net_id] = (kind, x + dx, y + dy)
+            offset += MOVED.size
+        for _ in range(removed):
+            self.entities.pop(REMOVED.unpack_from(payload, offset)[0], None)
+            offset += REMOVED.size
+
+        self.tick = tick
+        self.sent_ns = sent_ns
+        self.game_state = game_state
+        self.score = score
+        self.wave = wave
+        self.health = health
+        self.shield = shield
+        return True
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+from game.network.protocol import StateEncoder, frame
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 5050
+MAX_BUFFER = 256 * 1024
+
+class SpectatorConnection:
+    def __init__(self, writer):
+        self.writer = writer
+        self.address = writer.get_extra_info('peername')
+        self.task = asyncio.current_task()
+        self.needs_full = True
+        self.bytes_sent = 0
+        self.frames_sent = 0
+        self.frames_skipped = 0
+
+class SpectatorServer:
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self.encoder = StateEncoder()
+        self.clients = set()
+        self.loop = None
+        self.server = None
+        self.thread = None
+
+    async def start(self):
+        self.loop = asyncio.get_running_loop()
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        clients = list(self.clients)
+        for client in clients:
+            client.writer.close()
+        await asyncio.gather(*(client.task for client in clients), return_exceptions=True)
+        self.clients.clear()
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def handle_client(self, reader, writer):
+        client = SpectatorConnection(writer)
+        self.clients.add(client)
+        try:
+            # Espectadores não enviam nada; descarta em blocos limitados até a desconexão
+            while await reader.read(4096):
+                pass
+        except ConnectionError:
+            pass
+        finally:
+            self.clients.discard(client)
+            writer.close()
+
+    def broadcast(self, snapshot, payload):
+        delta_frame = frame(payload)
+        full_frame = None
+        for client in list(self.clients):
+            if client.writer.is_closing():
+                self.clients.discard(client)
+                continue
+            # Cliente lento: descarta deltas e reenvia o estado completo quando o buffer esvaziar
+            if client.writer.transport.get_write_buffer_size() > MAX_BUFFER:
+                client.needs_full = True
+                client.frames_skipped += 1
+                continue
+            if client.needs_full:
+                if full_frame is None:
+                    full_frame = frame(snapshot.encode_full())
+                data = full_frame
+                client.needs_full = False
+            else:
+                data = delta_frame
+            client.writer.write(data)
+            client.bytes_sent += len(data)
+            client.frames_sent += 1
+
+    def publish(self, game):
+        snapshot, payload = self.encoder.encode(game)
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.broadcast, snapshot, payload)
+        return snapshot
+
+    def start_in_thread(self):
+        loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=loop.run_forever, daemon=True)
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.start(), loop).result()
+        print(f"Servidor de espectadores em {self.host}:{self.port}")
+
+    def stop_thread(self):
+        if self.thread is None:
+            return
+        loop = self.loop
+        asyncio.run_coroutine_threadsafe(self.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        self.thread.join()
+        loop.close()
+        self.thread = None
@@ -2,31 +2,66 @@ import pygame
 import sys
 import os
 import random
+from concurrent.futures import ThreadPoolExecutor
 from config import *
 from game.managers.audio import AudioManager
 from game.managers.score import ScoreManager
+from game.managers.snapshot import SnapshotManager
+from game.managers.registry import EnemyRegistry
+from game.managers.wave import WaveController
+from game.managers.render import RenderTarget, RenderFrame
 from game.entities.player import Player
 from game.entities.enemies import Enemy, EnemyType
 from game.entities.bullets import Bullet, EnemyBullet
+from game.entities.patterns import PatternEmitter
+from game.network.server import SpectatorServer
 WAVE_TRANSITION_DURATION = 2000
 
+DAMAGE_SETTINGS = {
+    'player_bullet': {
+        EnemyType.BOSS: 3,
+        EnemyType.ASTEROID: 2,
+        EnemyType.COMMON: 1
+    },
+    'enemy_collision': {
+        EnemyType.BOSS: 6,
+        EnemyType.ASTEROID: 4,
+        EnemyType.COMMON: 2
+    },
+    'enemy_bullet': 3
+}
+
+SCORE_VALUES = {
+    EnemyType.BOSS: 100,
+    EnemyType.ASTEROID: 25,
+    EnemyType.COMMON: 10
+}
+
 class AstroSmash:
-    def __init__(self):
+    def __init__(self, server=None, pipelined=PIPELINED):
         pygame.init()
         pygame.display.set_caption("AstroSmash MVP")
         
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        self.render_target = RenderTarget((WIDTH, HEIGHT), RENDER_SCALE, WINDOW_SIZE, FULLSCREEN,
+                                          SMOOTH_SCALING, HARDWARE_SCALING)
+        self.screen = self.render_target.surface
         self.clock = pygame.time.Clock()
         self.running = True
+        self.server = server
+        self.pipelined = pipelined
+        self.render_frames = (RenderFrame(), RenderFrame())
+        self.render_frame_index = 0
         
         self.audio_manager = AudioManager()
         self.load_audio()
         self.score_manager = ScoreManager()
+        self.snapshots = SnapshotManager()
         
         self.all_sprites = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
+        self.enemies = EnemyRegistry()
         self.bullets = pygame.sprite.Group()
         self.enemy_bullets = pygame.sprite.Group()
+        self.boss_emitter = PatternEmitter()
         
         self.player = Player(self.audio_manager)
         self.all_sprites.add(self.player)
@@ -42,23 +77,7 @@ class AstroSmash:
         self.enemies_per_wave = 1
         self.wave_transition_start = 0
         self.show_wave_message = False
-        
-    def spawn_wave_enemies(self):
-        base_enemies = 8 + self.score_manager.wave * 2
-        min_interval = max(200, 800 - self.score_manager.wave * 30) 
-        
-        for i in range(base_enemies):
-            spawn_time = i * min_interval  
-            pygame.time.set_timer(pygame.USEREVENT + i, spawn_time, True)
-        
-        self.enemy_spawn_interval = min_interval * 2
-        self.last_enemy_spawn = pygame.time.get_ticks()
-        
-        self.show_wave_message = True
-        self.wave_transition_start = pygame.time.get_ticks()
-        if self.audio_manager.has_sound and 'wave' in self.audio_manager.sounds:
-            self.audio_manager.play_sound('wave')
-        
+        self.waves = WaveController(self)
         
     def generate_stars(self, count):
         return [(random.randint(0, WIDTH), random.randint(0, HEIGHT), random.randint(1, 3)) 
@@ -103,11 +122,8 @@ class AstroSmash:
         return sounds_loaded
     
     def spawn_enemy(self):
-        now = pygame.time.get_ticks()
-        
-        if self.score_manager.wave % 5 == 0 and not self.boss_active and len([e for e in self.enemies if e.enemy_type == EnemyType.BOSS]) == 0:
+        if self.waves.is_boss_wave() and self.enemies.count(EnemyType.BOSS) == 0:
             enemy = Enemy(EnemyType.BOSS)
-            self.boss_active = True
             if self.audio_manager.has_sound:
                 self.audio_manager.play_sound('chefe')
         else:
@@ -120,18 +136,52 @@ class AstroSmash:
         self.enemies.add(enemy)
     
     def run(self):
-        while self.running:
-            self.clock.tick(FPS)
-            self.handle_events()
-            self.update()
-            self.draw()
-            pygame.display.flip()
+        if self.pipelined:
+            self.run_pipelined()
+        else:
+            self.run_serial()
         
+        if self.server:
+            self.server.stop_thread()
         pygame.quit()
         sys.exit()
     
-    def handle_events(self):
-        for event in pygame.event.get():
+    def run_serial(self):
+        while self.running:
+            self.clock.tick(FPS)
+            self.render(self.simulate(pygame.event.get()))
+    
+    def run_pipelined(self):
+        # A thread principal bombeia eventos e desenha o tick N enquanto o worker simula o N+1
+        frame = self.capture_frame()
+        with ThreadPoolExecutor(max_workers=1) as worker:
+            while self.running:
+                self.clock.tick(FPS)
+                pending = worker.submit(self.simulate, pygame.event.get())
+                self.render(frame)
+                frame = pending.result()
+    
+    def simulate(self, events):
+        self.handle_events(events)
+        self.update()
+        if self.server:
+            self.server.publish(self)
+        return self.capture_frame()
+    
+    def capture_frame(self):
+        frame = self.render_frames[self.render_frame_index]
+        self.render_frame_index ^= 1
+        return frame.capture(self)
+    
+    def render(self, frame):
+        self.draw(frame)
+        self.render_target.present()
+        pygame.display.flip()
+    
+    def handle_events(self, events):
+        for event in events:
+            if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                event.pos = self.render_target.to_logical(event.pos)
             if event.type == pygame.QUIT:
                 self.running = False
             if event.type == pygame.KEYDOWN:
@@ -140,6 +190,14 @@ class AstroSmash:
                         self.game_state = PAUSE
                     elif self.game_state == PAUSE:
                         self.game_state = PLAYING
+                if event.key == pygame.K_F5 and self.game_state in [PLAYING, PAUSE]:
+                    previous_state = self.game_state
+                    if self.snapshots.rewind(self, FPS * 2):
+                        self.resume_from_snapshot(previous_state)
+                if event.key == pygame.K_F9:
+                    previous_state = self.game_state
+                    if self.snapshots.load(self):
+                        self.resume_from_snapshot(previous_state)
                 if event.key == pygame.K_SPACE and self.game_state == PLAYING:
                     self.player.shoot(self.all_sprites, self.bullets)
                 if event.key == pygame.K_RETURN and self.game_state in [MENU, GAME_OVER, SPLASH]:
@@ -157,77 +215,22 @@ class AstroSmash:
         elif self.game_state == PLAYING:
             self.all_sprites.update()
             
-            self.boss_active = any(e.enemy_type == EnemyType.BOSS for e in self.enemies)
-            
             now = pygame.time.get_ticks()
-            enemies_on_screen = len(self.enemies)
-            max_enemies = 5 + self.score_manager.wave
-            
-            if (now - self.last_enemy_spawn > self.enemy_spawn_interval and 
-                enemies_on_screen < max_enemies):
-                
-                self.last_enemy_spawn = now
-                self.spawn_enemy()
-                
-                if random.random() < 0.2:
-                    
-                    self.enemy_spawn_interval = max(200, self.enemy_spawn_interval - 30)
-                    
-                    
-                    if self.enemy_spawn_interval <= 300:  
-                        self.score_manager.increase_wave()
-                        self.enemy_spawn_interval = 800 
-                        self.show_wave_message = True
-                        self.wave_transition_start = now
-            
-
-            if (not self.boss_active and 
-                enemies_on_screen == 0 and 
-                now - self.last_enemy_spawn > 3000):  
-                self.score_manager.increase_wave()
-                self.enemy_spawn_interval = 800
-                self.last_enemy_spawn = now
-            
+            self.waves.update(now)
+            self.update_boss_attacks(now)
             self.check_collisions()
             
-            if self.show_wave_message:
-                if now - self.wave_transition_start > 2000:
-                    self.show_wave_message = False
-        
-    def next_wave(self):
-        self.score_manager.increase_wave()
+            if self.game_state == PLAYING:
+                self.snapshots.push(self)
+                self.snapshots.autosave(now)
         
-        for i in range(50):
-            pygame.time.set_timer(pygame.USEREVENT + i, 0)
+    def update_boss_attacks(self, now):
+        for enemy in self.enemies.of_type(EnemyType.BOSS):
+            if enemy.rect.top > 20:
+                self.boss_emitter.update(enemy, self.player.rect.center, now, self.all_sprites, self.enemy_bullets)
         
-        self.spawn_wave_enemies()
-        
-        if self.score_manager.wave % 5 == 0:
-            self.spawn_boss()
-            
     def check_collisions(self):
-        DAMAGE_SETTINGS = {
-            'player_bullet': {
-                EnemyType.BOSS: 3,
-                EnemyType.ASTEROID: 2,
-                EnemyType.COMMON: 1
-            },
-            'enemy_collision': {
-                EnemyType.BOSS: 6,
-                EnemyType.ASTEROID: 4,
-                EnemyType.COMMON: 2
-            },
-            'enemy_bullet': 3
-        }
-        
-        SCORE_VALUES = {
-            EnemyType.BOSS: 100,
-            EnemyType.ASTEROID: 25,
-            EnemyType.COMMON: 10
-        }
-        
         bullet_hits = pygame.sprite.groupcollide(self.bullets, self.enemies, True, False)
-        enemies_defeated_in_this_check = 0  
         
         for bullet, enemies in bullet_hits.items():
             for enemy in enemies:
@@ -237,10 +240,7 @@ class AstroSmash:
                         self.audio_manager.play_sound('hit')
                     
                     self.score_manager.add_score(SCORE_VALUES[enemy.enemy_type])
-                    enemies_defeated_in_this_check += 1 
-                    
-                    if enemy.enemy_type == EnemyType.BOSS:
-                        self.boss_active = False
+                    self.waves.on_enemy_defeated(enemy)
 
         if not self.player.invincible:
             hits = pygame.sprite.spritecollide(self.player, self.enemies, True)
@@ -261,15 +261,15 @@ class AstroSmash:
             
             if self.player.take_damage(DAMAGE_SETTINGS['enemy_bullet']):
                 self.game_over()
-        
-        if enemies_defeated_in_this_check > 0:
-            self.enemies_defeated += enemies_defeated_in_this_check
-            
-            if self.enemies_defeated >= self.enemies_per_wave and not self.boss_active:
-                self.score_manager.increase_wave()
-                self.enemies_defeated = 0
-                self.enemies_per_wave = 15 + self.score_manager.wave * 2
-                self.spawn_wave_enemies()
+    
+    def resume_from_snapshot(self, previous_state):
+        # Snapshots são sempre capturados em PLAYING
+        if previous_state == PAUSE:
+            self.game_state = PAUSE
+        elif previous_state != PLAYING:
+            self.audio_manager.stop_music()
+            if self.audio_manager.has_sound:
+                self.audio_manager.play_music('fundo')
     
     def game_over(self):
         self.game_state = GAME_OVER
@@ -285,6 +285,8 @@ class AstroSmash:
         self.bullets.empty()
         self.enemy_bullets.empty()
         self.boss_active = False
+        self.boss_emitter.reset()
+        self.snapshots.ring.clear()
         
         self.audio_manager.stop_music()
         self.player = Player(self.audio_manager)
@@ -292,29 +294,29 @@ class AstroSmash:
         
         self.score_manager.score = 0
         self.score_manager.wave = 1
-        self.enemy_spawn_interval = 1000
+        self.waves.reset()
         
         if self.audio_manager.has_sound:
             self.audio_manager.play_music('fundo')
     
-    def draw(self):
+    def draw(self, frame):
         self.screen.fill(BLACK)
         self.draw_stars()
-        self.all_sprites.draw(self.screen)
-        self.draw_hud()
-        self.draw_state_screens()
-        if self.show_wave_message:
-            self.draw_wave_transition()
+        self.render_target.draw_sprites(frame.sprites)
+        self.draw_hud(frame)
+        self.draw_state_screens(frame)
+        if frame.show_wave_message:
+            self.draw_wave_transition(frame)
 
-    def draw_wave_transition(self):
+    def draw_wave_transition(self, frame):
         now = pygame.time.get_ticks()
-        if now - self.wave_transition_start < WAVE_TRANSITION_DURATION:
-            progress = (now - self.wave_transition_start) / WAVE_TRANSITION_DURATION
+        if now - frame.wave_transition_start < WAVE_TRANSITION_DURATION:
+            progress = (now - frame.wave_transition_start) / WAVE_TRANSITION_DURATION
             alpha = 255 * (1 - abs(progress - 0.5)) * 2
             
-            s = pygame.Surface((WIDTH, 100), pygame.SRCALPHA)
+            s = pygame.Surface(self.render_target.rect(0, 0, WIDTH, 100).size, pygame.SRCALPHA)
             s.fill((0, 0, 0, 150))
-            self.screen.blit(s, (0, HEIGHT//2 - 50))
+            self.screen.blit(s, self.render_target.point(0, HEIGHT//2 - 50))
             
             size = 48 + int(10 * abs(progress - 0.5))
             color = (
@@ -323,81 +325,85 @@ class AstroSmash:
                 0
             )
             
-            self.draw_text(f"WAVE {self.score_manager.wave}", size, WIDTH//2, HEIGHT//2, color)
-        else:
-            self.show_wave_message = False
+            self.draw_text(f"WAVE {frame.wave}", size, WIDTH//2, HEIGHT//2, color)
     
     def draw_stars(self):
         now = pygame.time.get_ticks()
+        target = self.render_target
         for x, y, size in self.stars:
             brightness = min(255, 50 + abs((now // 10 + x + y) % 510 - 255))
             pygame.draw.circle(self.screen, (brightness, brightness, brightness), 
-                              (x, (y + now // 50) % HEIGHT), size)
+                              target.point(x, (y + now // 50) % HEIGHT), target.length(size))
     
-    def draw_hud(self):
-        self.draw_text(f"Pontuação: {self.score_manager.score}", 30, 70, 20)
-        self.draw_text(f"Recorde: {self.score_manager.high_score}", 30, 70, 50)
-        self.draw_text(f"Nível: {self.score_manager.wave}", 30, WIDTH - 70, 20)
+    def draw_hud(self, frame):
+        self.draw_text(f"Pontuação: {frame.score}", 30, 70, 20)
+        self.draw_text(f"Recorde: {frame.high_score}", 30, 70, 50)
+        self.draw_text(f"Nível: {frame.wave}", 30, WIDTH - 70, 20)
         
         # Barras de status
-        pygame.draw.rect(self.screen, (50, 50, 50), (WIDTH - 120, 50, 104, 20))
-        pygame.draw.rect(self.screen, RED, (WIDTH - 118, 52, self.player.health, 16))
-        pygame.draw.rect(self.screen, (50, 50, 50), (WIDTH - 120, 80, 104, 10))
-        pygame.draw.rect(self.screen, BLUE, (WIDTH - 118, 82, self.player.shield, 6))
-        pygame.draw.rect(self.screen, (50, 50, 50), (WIDTH//2 - 50, 10, 100, 10))
-        pygame.draw.rect(self.screen, (min(255, self.player.heat * 2.55), max(0, 255 - self.player.heat * 2.55), 0), 
-                        (WIDTH//2 - 50, 10, self.player.heat, 10))
+        target = self.render_target
+        pygame.draw.rect(self.screen, (50, 50, 50), target.rect(WIDTH - 120, 50, 104, 20))
+        pygame.draw.rect(self.screen, RED, target.rect(WIDTH - 118, 52, frame.health, 16))
+        pygame.draw.rect(self.screen, (50, 50, 50), target.rect(WIDTH - 120, 80, 104, 10))
+        pygame.draw.rect(self.screen, BLUE, target.rect(WIDTH - 118, 82, frame.shield, 6))
+        pygame.draw.rect(self.screen, (50, 50, 50), target.rect(WIDTH//2 - 50, 10, 100, 10))
+        pygame.draw.rect(self.screen, (min(255, frame.heat * 2.55), max(0, 255 - frame.heat * 2.55), 0), 
+                        target.rect(WIDTH//2 - 50, 10, frame.heat, 10))
         
-        if self.boss_active:
+        if frame.boss_active:
             self.draw_text("ANTEÇÃO! CHEFÃO A CAMINHO", 40, WIDTH//2, 80, ORANGE)
     
-    def draw_state_screens(self):
-        if self.game_state == SPLASH:
+    def draw_state_screens(self, frame):
+        if frame.game_state == SPLASH:
             self.draw_splash_screen()
-        elif self.game_state == MENU:
-            self.draw_menu()
-        elif self.game_state == PAUSE:
+        elif frame.game_state == MENU:
+            self.draw_menu(frame)
+        elif frame.game_state == PAUSE:
             self.draw_pause()
-        elif self.game_state == GAME_OVER:
-            self.draw_game_over()
+        elif frame.game_state == GAME_OVER:
+            self.draw_game_over(frame)
     
     def draw_splash_screen(self):
-        s = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        s = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
         s.fill((0, 0, 0, 180))
         self.screen.blit(s, (0, 0))
         self.draw_text("SUPER FAG ASTROSMASH", 72, WIDTH//2, HEIGHT//3)
         self.draw_text("Dedicatória: Professor Jeferson", 36, WIDTH//2, HEIGHT//2)
     
-    def draw_menu(self):
-        s = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    def draw_menu(self, frame):
+        s = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
         s.fill((0, 0, 0, 180))
         self.screen.blit(s, (0, 0))
         self.draw_text("SUPER FAG ASTROSMASH", 64, WIDTH//2, HEIGHT//4)
-        self.draw_text(f"Recorde: {self.score_manager.high_score}", 36, WIDTH//2, HEIGHT//3)
+        self.draw_text(f"Recorde: {frame.high_score}", 36, WIDTH//2, HEIGHT//3)
         self.draw_text("Pressione ENTER para Jogar", 36, WIDTH//2, HEIGHT//2)
         self.draw_text("W,A,S,D para mover | Espaço para atirar", 24, WIDTH//2, HEIGHT*3//4)
     
     def draw_pause(self):
-        s = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        s = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
         s.fill((0, 0, 0, 180))
         self.screen.blit(s, (0, 0))
         self.draw_text("PAUSADO", 64, WIDTH//2, HEIGHT//2)
         self.draw_text("Pressione ESC para continuar", 24, WIDTH//2, HEIGHT//2 + 50)
     
-    def draw_game_over(self):
-        s = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    def draw_game_over(self, frame):
+        s = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
         s.fill((0, 0, 0, 180))
         self.screen.blit(s, (0, 0))
         self.draw_text("FIM DE JOGO", 64, WIDTH//2, HEIGHT//2 - 50)
-        self.draw_text(f"Pontuação: {self.score_manager.score}", 36, WIDTH//2, HEIGHT//2)
+        self.draw_text(f"Pontuação: {frame.score}", 36, WIDTH//2, HEIGHT//2)
         self.draw_text("Pressione ENTER para recomeçar", 24, WIDTH//2, HEIGHT//2 + 80)
     
     def draw_text(self, text, size, x, y, color=WHITE):
-        font = pygame.font.Font(None, size)
+        font = pygame.font.Font(None, self.render_target.length(size))
         text_surface = font.render(text, True, color)
-        text_rect = text_surface.get_rect(center=(x, y))
+        text_rect = text_surface.get_rect(center=self.render_target.point(x, y))
         self.screen.blit(text_surface, text_rect)
 
 if __name__ == "__main__":
-    game = AstroSmash()
+    server = None
+    if '--servidor' in sys.argv:
+        server = SpectatorServer()
+        server.start_in_thread()
+    game = AstroSmash(server, PIPELINED or '--pipeline' in sys.argv)
     game.run()
\ No newline at end of file